@@ -2,6 +2,7 @@
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 
@@ -16,6 +17,15 @@ from .const import (
     ATTR_S_PLUS_PLUS,
     ATTR_ACTIVE_THRESHOLDS,
     ATTR_RESOLUTION_MODE,
+    ATTR_THRESHOLD_UNIT,
+    CONF_MAX_ACTIVE_ALARMS,
+    DEFAULT_MAX_ACTIVE_ALARMS,
+    CONF_ESCALATE_AFTER,
+    CONF_RENOTIFY_INTERVAL,
+    CONF_EXPIRE_ACKNOWLEDGED_AFTER,
+    DEFAULT_ESCALATE_AFTER,
+    DEFAULT_RENOTIFY_INTERVAL,
+    DEFAULT_EXPIRE_ACKNOWLEDGED_AFTER,
 )
 
 SETUP_ENTRY_ID = "setup"
@@ -81,9 +91,14 @@ class EasyThresholdsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(sensor_entity)
                 self._abort_if_unique_id_configured()
 
+                # Thresholds are entered in the sensor's current unit; a sensor
+                # that is not reporting yet adopts the first unit it reports
+                state = self.hass.states.get(sensor_entity)
+                unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) if state else None
+
                 return self.async_create_entry(
                     title=sensor_entity,
-                    data=user_input,
+                    data={**user_input, ATTR_THRESHOLD_UNIT: unit},
                 )
 
         return self.async_show_form(
@@ -136,9 +151,9 @@ class EasyThresholdsOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Handle options flow - edit sensor configuration."""
-        # If this is a setup entry, no options available
+        # The setup entry holds the global alarm monitor options
         if self.config_entry.data.get("setup"):
-            return self.async_abort(reason="no_options")
+            return await self.async_step_monitor(user_input)
 
         if user_input is not None:
             # Validate thresholds
@@ -161,6 +176,50 @@ class EasyThresholdsOptionsFlow(config_entries.OptionsFlow):
             data_schema=self._get_options_schema(),
         )
 
+    async def async_step_monitor(self, user_input=None):
+        """Handle options flow - edit alarm monitor configuration."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="monitor",
+            data_schema=self._get_monitor_schema(),
+        )
+
+    def _get_monitor_schema(self):
+        """Get schema for alarm monitor options."""
+        current_options = self.config_entry.options
+
+        return vol.Schema(
+            {
+                vol.Required(
+                    CONF_MAX_ACTIVE_ALARMS,
+                    default=current_options.get(
+                        CONF_MAX_ACTIVE_ALARMS, DEFAULT_MAX_ACTIVE_ALARMS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_ESCALATE_AFTER,
+                    default=current_options.get(
+                        CONF_ESCALATE_AFTER, DEFAULT_ESCALATE_AFTER
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_RENOTIFY_INTERVAL,
+                    default=current_options.get(
+                        CONF_RENOTIFY_INTERVAL, DEFAULT_RENOTIFY_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_EXPIRE_ACKNOWLEDGED_AFTER,
+                    default=current_options.get(
+                        CONF_EXPIRE_ACKNOWLEDGED_AFTER,
+                        DEFAULT_EXPIRE_ACKNOWLEDGED_AFTER,
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            }
+        )
+
     def _get_options_schema(self):
         """Get schema for options."""
         current_data = self.config_entry.data
@@ -20,15 +20,56 @@ THRESHOLD_LEVELS = [
     THRESHOLD_CRITICAL_HIGH,
 ]
 
+# Alarm severities
+SEVERITY_WARNING = "warning"
+SEVERITY_CRITICAL = "critical"
+
+# Binary sensor alarms have no threshold and are treated as critical
+THRESHOLD_SEVERITY = {
+    THRESHOLD_CRITICAL_LOW: SEVERITY_CRITICAL,
+    THRESHOLD_WARNING_LOW: SEVERITY_WARNING,
+    THRESHOLD_WARNING_HIGH: SEVERITY_WARNING,
+    THRESHOLD_CRITICAL_HIGH: SEVERITY_CRITICAL,
+}
+
+# Alarm capacity
+CONF_MAX_ACTIVE_ALARMS = "max_active_alarms"
+DEFAULT_MAX_ACTIVE_ALARMS = 100
+
+# Alarm timers (0 disables the timer)
+CONF_ESCALATE_AFTER = "escalate_after_minutes"
+CONF_RENOTIFY_INTERVAL = "renotify_interval_minutes"
+CONF_EXPIRE_ACKNOWLEDGED_AFTER = "expire_acknowledged_after_hours"
+DEFAULT_ESCALATE_AFTER = 0
+DEFAULT_RENOTIFY_INTERVAL = 0
+DEFAULT_EXPIRE_ACKNOWLEDGED_AFTER = 0
+
+# Scheduled actions
+SCHEDULE_ESCALATE = "escalate"
+SCHEDULE_RENOTIFY = "renotify"
+SCHEDULE_EXPIRE = "expire"
+
+SCHEDULE_ACTIONS = (
+    SCHEDULE_ESCALATE,
+    SCHEDULE_RENOTIFY,
+    SCHEDULE_EXPIRE,
+)
+
 # Service names
 SERVICE_CLEAR_ALARM = "clear_alarm"
+SERVICE_ACKNOWLEDGE_ALARM = "acknowledge_alarm"
 
 # Attribute names
 ATTR_ACTIVE_ALARMS = "active_alarms"
 ATTR_ALARM_NAME = "alarm_name"
 ATTR_TIMESTAMP = "timestamp_triggered"
+ATTR_ACKNOWLEDGED = "timestamp_acknowledged"
 ATTR_THRESHOLD_VALUE = "threshold_value"
 ATTR_SENSOR_ENTITY = "sensor_entity"
+ATTR_SEVERITY = "severity"
+ATTR_OVERFLOW_ALARMS = "overflow_alarms"
+ATTR_OVERFLOW_TOTAL = "total"
+ATTR_OVERFLOW_BY_SEVERITY = "by_severity"
 ATTR_S_MINUS_MINUS = "s_minus_minus"  # Critical low
 ATTR_S_MINUS = "s_minus"  # Warning low
 ATTR_S_PLUS = "s_plus"  # Warning high
@@ -36,6 +77,7 @@ ATTR_S_PLUS_PLUS = "s_plus_plus"  # Critical high
 ATTR_ACTIVE_THRESHOLDS = "active_thresholds"
 ATTR_RESOLUTION_MODE = "resolution_mode"
 ATTR_BINARY_SENSORS = "binary_sensors"
+ATTR_THRESHOLD_UNIT = "threshold_unit"
 
 # Resolution modes
 RESOLUTION_AUTOMATIC = "automatic"
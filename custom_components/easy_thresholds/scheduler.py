@@ -0,0 +1,117 @@
+"""Alarm timer scheduler for Easy Thresholds integration."""
+
+import heapq
+from datetime import datetime
+from itertools import count
+from typing import Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+
+from .const import SCHEDULE_ACTIONS
+
+
+class AlarmScheduler:
+    """Run all alarm timers from one priority queue with a single wakeup."""
+
+    def __init__(
+        self, hass: HomeAssistant, on_timer: Callable[[str, str], None]
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._on_timer = on_timer
+        self._queue: List[Tuple[datetime, int, str, str]] = []
+        # Latest sequence number per (alarm_name, action); older queue entries are stale
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._sequence = count()
+        self._unsub_wakeup: Optional[CALLBACK_TYPE] = None
+        self._wakeup_time: Optional[datetime] = None
+
+    @callback
+    def async_schedule(self, alarm_name: str, action: str, when: datetime) -> None:
+        """Schedule an action for an alarm, replacing any pending one."""
+        sequence = next(self._sequence)
+        self._pending[(alarm_name, action)] = sequence
+        heapq.heappush(self._queue, (when, sequence, alarm_name, action))
+
+        # Drop cancelled entries once they dominate the queue
+        if len(self._queue) > 2 * len(self._pending) + 16:
+            self._queue = [
+                entry
+                for entry in self._queue
+                if self._pending.get((entry[2], entry[3])) == entry[1]
+            ]
+            heapq.heapify(self._queue)
+
+        self._async_arm()
+
+    @callback
+    def async_cancel(self, alarm_name: str, action: Optional[str] = None) -> None:
+        """Cancel one or all pending actions for an alarm."""
+        actions = SCHEDULE_ACTIONS if action is None else (action,)
+        for scheduled_action in actions:
+            self._pending.pop((alarm_name, scheduled_action), None)
+
+        if not self._pending:
+            self._queue.clear()
+            self._async_disarm()
+
+    @callback
+    def async_cancel_all(self) -> None:
+        """Cancel the wakeup and drop all pending actions."""
+        self._async_disarm()
+        self._queue.clear()
+        self._pending.clear()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the scheduler."""
+        self.async_cancel_all()
+
+    def _is_pending(self, entry: Tuple[datetime, int, str, str]) -> bool:
+        """Check if a queue entry is still the live one for its key."""
+        return self._pending.get((entry[2], entry[3])) == entry[1]
+
+    @callback
+    def _async_arm(self) -> None:
+        """Point the single wakeup at the earliest pending action."""
+        while self._queue and not self._is_pending(self._queue[0]):
+            heapq.heappop(self._queue)
+
+        if not self._queue:
+            self._async_disarm()
+            return
+
+        when = self._queue[0][0]
+        if when == self._wakeup_time:
+            return
+
+        self._async_disarm()
+        self._wakeup_time = when
+        self._unsub_wakeup = async_track_point_in_utc_time(
+            self.hass, self._async_on_wakeup, when
+        )
+
+    @callback
+    def _async_disarm(self) -> None:
+        """Cancel the pending wakeup."""
+        if self._unsub_wakeup is not None:
+            self._unsub_wakeup()
+        self._unsub_wakeup = None
+        self._wakeup_time = None
+
+    @callback
+    def _async_on_wakeup(self, now: datetime) -> None:
+        """Run every action that is due and re-arm for the next one."""
+        self._unsub_wakeup = None
+        self._wakeup_time = None
+
+        while self._queue and self._queue[0][0] <= now:
+            entry = heapq.heappop(self._queue)
+            if not self._is_pending(entry):
+                continue
+            _, _, alarm_name, action = entry
+            del self._pending[(alarm_name, action)]
+            self._on_timer(alarm_name, action)
+
+        self._async_arm()
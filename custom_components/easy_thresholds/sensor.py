@@ -1,32 +1,79 @@
 """Sensor for Easy Thresholds integration."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import math
+import re
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor.const import UNIT_CONVERTERS
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    _LOGGER,
     ATTR_ACTIVE_ALARMS,
     ATTR_ALARM_NAME,
     ATTR_TIMESTAMP,
+    ATTR_ACKNOWLEDGED,
     ATTR_THRESHOLD_VALUE,
+    ATTR_SENSOR_ENTITY,
+    ATTR_SEVERITY,
+    ATTR_OVERFLOW_ALARMS,
+    ATTR_OVERFLOW_TOTAL,
+    ATTR_OVERFLOW_BY_SEVERITY,
     ATTR_S_MINUS_MINUS,
     ATTR_S_MINUS,
     ATTR_S_PLUS,
     ATTR_S_PLUS_PLUS,
     ATTR_ACTIVE_THRESHOLDS,
     ATTR_RESOLUTION_MODE,
+    ATTR_THRESHOLD_UNIT,
     ICON_ALARM_MONITOR,
     THRESHOLD_CRITICAL_LOW,
     THRESHOLD_WARNING_LOW,
     THRESHOLD_WARNING_HIGH,
     THRESHOLD_CRITICAL_HIGH,
     RESOLUTION_AUTOMATIC,
+    SEVERITY_WARNING,
+    SEVERITY_CRITICAL,
+    THRESHOLD_SEVERITY,
+    CONF_MAX_ACTIVE_ALARMS,
+    DEFAULT_MAX_ACTIVE_ALARMS,
+    CONF_ESCALATE_AFTER,
+    CONF_RENOTIFY_INTERVAL,
+    CONF_EXPIRE_ACKNOWLEDGED_AFTER,
+    DEFAULT_ESCALATE_AFTER,
+    DEFAULT_RENOTIFY_INTERVAL,
+    DEFAULT_EXPIRE_ACKNOWLEDGED_AFTER,
+    SCHEDULE_ESCALATE,
+    SCHEDULE_RENOTIFY,
+    SCHEDULE_EXPIRE,
 )
+from .scheduler import AlarmScheduler
+
+# Plain decimal or scientific notation; rejects "unknown", "unavailable", "nan", ...
+_NUMERIC_STATE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Deduplicated in a fixed order so unit lookups are deterministic
+_CONVERTERS = tuple(dict.fromkeys(UNIT_CONVERTERS.values()))
+
+# Extra points used to check that a conversion is affine
+_AFFINE_PROBES = (2.0, 10.0)
+
+
+class _FoldedAlarm(NamedTuple):
+    """Compact record of an alarm folded out of the detailed list."""
+
+    timestamp: str
+    threshold_value: Optional[str]
+    sensor_entity: str
+    severity: str
+    acknowledged: Optional[str]
 
 
 async def async_setup_entry(
@@ -59,6 +106,20 @@ class AlarmMonitorSensor(SensorEntity):
         self._sensor_configs: Dict[str, Dict[str, Any]] = {}
         self._binary_sensors: List[Dict[str, str]] = []
         self._last_notified_alarms: set = set()  # Track notified alarms for debouncing
+        self._max_active_alarms: int = DEFAULT_MAX_ACTIVE_ALARMS
+        # Alarms folded out of the detailed list; they keep their timers
+        self._overflow_alarms: Dict[str, _FoldedAlarm] = {}
+        self._overflow_by_severity: Dict[str, int] = {}
+        self._escalate_after = timedelta(minutes=DEFAULT_ESCALATE_AFTER)
+        self._renotify_interval = timedelta(minutes=DEFAULT_RENOTIFY_INTERVAL)
+        self._expire_acknowledged_after = timedelta(
+            hours=DEFAULT_EXPIRE_ACKNOWLEDGED_AFTER
+        )
+        self._scheduler = AlarmScheduler(hass, self._on_alarm_timer)
+        # Per-sensor (source unit, conversion) into the threshold unit
+        self._unit_conversions: Dict[
+            str, Tuple[Optional[str], Optional[Callable[[float], float]]]
+        ] = {}
 
         # Parse configuration
         self._parse_config(config_entry.data)
@@ -70,6 +131,25 @@ class AlarmMonitorSensor(SensorEntity):
 
     def _parse_config(self, config_data: Dict[str, Any]) -> None:
         """Parse configuration data from all entries."""
+        options = self.config_entry.options
+        self._max_active_alarms = int(
+            options.get(CONF_MAX_ACTIVE_ALARMS, DEFAULT_MAX_ACTIVE_ALARMS)
+        )
+        self._escalate_after = timedelta(
+            minutes=options.get(CONF_ESCALATE_AFTER, DEFAULT_ESCALATE_AFTER)
+        )
+        self._renotify_interval = timedelta(
+            minutes=options.get(CONF_RENOTIFY_INTERVAL, DEFAULT_RENOTIFY_INTERVAL)
+        )
+        self._expire_acknowledged_after = timedelta(
+            hours=options.get(
+                CONF_EXPIRE_ACKNOWLEDGED_AFTER, DEFAULT_EXPIRE_ACKNOWLEDGED_AFTER
+            )
+        )
+        previous_units = {
+            entity_id: config.get(ATTR_THRESHOLD_UNIT)
+            for entity_id, config in self._sensor_configs.items()
+        }
         self._sensor_configs.clear()
         for entry in self.hass.config_entries.async_entries(DOMAIN):
             sensor_entity = entry.data.get("sensor_entity")
@@ -80,6 +160,12 @@ class AlarmMonitorSensor(SensorEntity):
                     config.update(entry.options)
                 self._sensor_configs[sensor_entity] = config
 
+        # Drop cached conversions only for sensors whose threshold unit changed
+        for entity_id, previous_unit in previous_units.items():
+            config = self._sensor_configs.get(entity_id)
+            if config is None or config.get(ATTR_THRESHOLD_UNIT) != previous_unit:
+                self._unit_conversions.pop(entity_id, None)
+
     async def async_added_to_hass(self) -> None:
         """Subscribe to sensor state changes and config entry updates."""
         # Parse config to get all current sensors from all entries
@@ -89,6 +175,9 @@ class AlarmMonitorSensor(SensorEntity):
         for entry in self.hass.config_entries.async_entries(DOMAIN):
             self.async_on_remove(entry.add_update_listener(self._async_on_entry_update))
 
+        # Stop all alarm timers on removal
+        self.async_on_remove(self._scheduler.async_shutdown)
+
         # Track ALL state changes for our sensors
         self.async_on_remove(
             self.hass.bus.async_listen(
@@ -101,23 +190,30 @@ class AlarmMonitorSensor(SensorEntity):
         self, hass: HomeAssistant, entry: ConfigEntry
     ) -> None:
         """Handle config entry update - re-check alarms with new thresholds."""
+        timer_options = self._get_timer_options()
+
         # Re-parse to get new thresholds
         self._parse_config(self.config_entry.data)
 
+        # Queued timers were scheduled under the old options
+        if self._get_timer_options() != timer_options:
+            self._reschedule_alarm_timers()
+
+        # Capacity may have been lowered or raised
+        self._enforce_alarm_capacity()
+        self._refill_alarm_capacity()
+
         # Get the sensor that was updated
         sensor_entity = entry.data.get("sensor_entity")
         if sensor_entity:
             # Check current state against new thresholds
             state = self.hass.states.get(sensor_entity)
-            if state and state.state not in ("unknown", "unavailable"):
-                try:
-                    value = float(state.state)
-                    config = self._sensor_configs.get(sensor_entity)
-                    if config:
-                        # Re-check with new thresholds - this will clear or create alarms as needed
-                        self._check_numeric_sensor(sensor_entity, value, config)
-                except (ValueError, TypeError):
-                    pass
+            config = self._sensor_configs.get(sensor_entity)
+            if state and config:
+                value = self._normalize_state(sensor_entity, state, config)
+                if value is not None:
+                    # Re-check with new thresholds - this will clear or create alarms as needed
+                    self._check_numeric_sensor(sensor_entity, value, config)
 
         self.async_write_ha_state()
 
@@ -133,16 +229,14 @@ class AlarmMonitorSensor(SensorEntity):
             return
 
         # Handle numeric sensors
-        if entity_id in self._sensor_configs:
-            try:
-                value = float(new_state.state)
-            except (ValueError, TypeError):
+        config = self._sensor_configs.get(entity_id)
+        if config:
+            value = self._normalize_state(entity_id, new_state, config)
+            if value is None:
                 return
 
-            config = self._sensor_configs.get(entity_id)
-            if config:
-                self._check_numeric_sensor(entity_id, value, config)
-                self.async_write_ha_state()
+            self._check_numeric_sensor(entity_id, value, config)
+            self.async_write_ha_state()
 
         # Handle binary sensors
         for bs in self._binary_sensors:
@@ -197,6 +291,116 @@ class AlarmMonitorSensor(SensorEntity):
 
         self.async_write_ha_state()
 
+    def _normalize_state(
+        self, entity_id: str, state: State, config: Dict[str, Any]
+    ) -> Optional[float]:
+        """Return the state value in the threshold unit, or None if not usable."""
+        raw = state.state
+        if _NUMERIC_STATE.fullmatch(raw) is None:
+            return None
+
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if config.get(ATTR_THRESHOLD_UNIT) is None and unit is not None:
+            self._adopt_threshold_unit(entity_id, unit, config)
+
+        # Recompute the conversion only when the source unit changes
+        cached = self._unit_conversions.get(entity_id)
+        if cached is None or cached[0] != unit:
+            cached = (
+                unit,
+                self._get_unit_conversion(
+                    entity_id,
+                    state.attributes.get(ATTR_DEVICE_CLASS),
+                    unit,
+                    config.get(ATTR_THRESHOLD_UNIT),
+                ),
+            )
+            self._unit_conversions[entity_id] = cached
+
+        conversion = cached[1]
+        if conversion is None:
+            return None
+
+        try:
+            return conversion(float(raw))
+        except (ArithmeticError, ValueError):
+            # Non-affine conversions can be undefined for some values
+            return None
+
+    def _adopt_threshold_unit(
+        self, entity_id: str, unit: str, config: Dict[str, Any]
+    ) -> None:
+        """Store the first unit seen for a sensor added without one."""
+        config[ATTR_THRESHOLD_UNIT] = unit
+        self._unit_conversions.pop(entity_id, None)
+
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.data.get("sensor_entity") == entity_id:
+                _LOGGER.info(f"Using {unit} as threshold unit for {entity_id}")
+                self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, ATTR_THRESHOLD_UNIT: unit}
+                )
+                break
+
+    @staticmethod
+    def _get_unit_conversion(
+        entity_id: str,
+        device_class: Optional[str],
+        from_unit: Optional[str],
+        to_unit: Optional[str],
+    ) -> Optional[Callable[[float], float]]:
+        """Get the conversion from a sensor's unit into its threshold unit."""
+        # Unitless sensors compare raw values
+        if from_unit == to_unit:
+            return float
+
+        # The device class identifies the converter; scan the rest as a fallback
+        converter = UNIT_CONVERTERS.get(device_class) if device_class else None
+        if from_unit is None or to_unit is None:
+            # A unit on only one side cannot be compared
+            converter = None
+        elif converter is None or not (
+            from_unit in converter.VALID_UNITS and to_unit in converter.VALID_UNITS
+        ):
+            converter = next(
+                (
+                    candidate
+                    for candidate in _CONVERTERS
+                    if from_unit in candidate.VALID_UNITS
+                    and to_unit in candidate.VALID_UNITS
+                ),
+                None,
+            )
+
+        if converter is None:
+            _LOGGER.warning(
+                f"Cannot convert {entity_id} from {from_unit} "
+                f"to threshold unit {to_unit}"
+            )
+            return None
+
+        # Most conversions are affine and reduce to a multiply-add per value
+        try:
+            offset = converter.convert(0.0, from_unit, to_unit)
+            scale = converter.convert(1.0, from_unit, to_unit) - offset
+            affine = all(
+                math.isclose(
+                    converter.convert(probe, from_unit, to_unit),
+                    probe * scale + offset,
+                    rel_tol=1e-9,
+                    abs_tol=1e-9,
+                )
+                for probe in _AFFINE_PROBES
+            )
+        except (ArithmeticError, ValueError):
+            affine = False
+
+        if affine:
+            return lambda value: value * scale + offset
+
+        # Inverse or nonlinear units (e.g. km/kWh, Beaufort) convert per value
+        return lambda value: converter.convert(value, from_unit, to_unit)
+
     def _check_numeric_sensor(
         self, entity_id: str, value: float, config: Dict[str, Any]
     ) -> None:
@@ -247,6 +451,8 @@ class AlarmMonitorSensor(SensorEntity):
 
     def _alarm_exists(self, alarm_name: str) -> bool:
         """Check if alarm already exists."""
+        if alarm_name in self._overflow_alarms:
+            return True
         return any(
             alarm[ATTR_ALARM_NAME] == alarm_name for alarm in self._active_alarms
         )
@@ -260,22 +466,233 @@ class AlarmMonitorSensor(SensorEntity):
         """Create a new alarm."""
         alarm = {
             ATTR_ALARM_NAME: alarm_name,
-            ATTR_TIMESTAMP: datetime.now().isoformat(),
+            ATTR_TIMESTAMP: dt_util.now().isoformat(),
             ATTR_THRESHOLD_VALUE: threshold_value,
+            ATTR_SENSOR_ENTITY: sensor_entity,
+            ATTR_SEVERITY: THRESHOLD_SEVERITY.get(threshold_value, SEVERITY_CRITICAL),
         }
 
         self._active_alarms.append(alarm)
+        self._schedule_alarm_timers(alarm)
+        self._enforce_alarm_capacity()
 
         # Send notification
-        self._send_notification(alarm_name, sensor_entity, threshold_value)
+        self._send_notification(
+            alarm_name, sensor_entity, threshold_value, alarm[ATTR_SEVERITY]
+        )
+
+    def _get_alarm(self, alarm_name: str) -> Optional[Dict[str, Any]]:
+        """Get an alarm record by name; folded alarms are returned as a copy."""
+        folded = self._overflow_alarms.get(alarm_name)
+        if folded is not None:
+            return self._unfold_alarm(alarm_name, folded)
+
+        for alarm in self._active_alarms:
+            if alarm[ATTR_ALARM_NAME] == alarm_name:
+                return alarm
+        return None
+
+    def _get_timer_options(self) -> Tuple[timedelta, timedelta, timedelta]:
+        """Get the current alarm timer options."""
+        return (
+            self._escalate_after,
+            self._renotify_interval,
+            self._expire_acknowledged_after,
+        )
+
+    def _schedule_alarm_timers(self, alarm: Dict[str, Any]) -> None:
+        """Schedule the timers that apply to an alarm under the current options."""
+        now = dt_util.utcnow()
+        alarm_name = alarm[ATTR_ALARM_NAME]
+
+        # Acknowledged alarms only wait for expiry
+        if ATTR_ACKNOWLEDGED in alarm:
+            if self._expire_acknowledged_after:
+                self._scheduler.async_schedule(
+                    alarm_name,
+                    SCHEDULE_EXPIRE,
+                    now
+                    + self._get_time_left(
+                        alarm[ATTR_ACKNOWLEDGED], self._expire_acknowledged_after
+                    ),
+                )
+            return
+
+        if self._escalate_after and alarm[ATTR_SEVERITY] == SEVERITY_WARNING:
+            self._scheduler.async_schedule(
+                alarm_name,
+                SCHEDULE_ESCALATE,
+                now + self._get_time_left(alarm[ATTR_TIMESTAMP], self._escalate_after),
+            )
+        if self._renotify_interval:
+            self._scheduler.async_schedule(
+                alarm_name, SCHEDULE_RENOTIFY, now + self._renotify_interval
+            )
+
+    @staticmethod
+    def _get_time_left(since: str, delay: timedelta) -> timedelta:
+        """Get the part of a delay still left after a stored timestamp."""
+        started = dt_util.parse_datetime(since)
+        if started is None:
+            return delay
+
+        elapsed = dt_util.utcnow() - dt_util.as_utc(started)
+        return max(delay - elapsed, timedelta(0))
+
+    def _reschedule_alarm_timers(self) -> None:
+        """Rebuild the timer queue for all alarms under the current options."""
+        self._scheduler.async_cancel_all()
+        for alarm in self._active_alarms:
+            self._schedule_alarm_timers(alarm)
+        for alarm_name, folded in self._overflow_alarms.items():
+            self._schedule_alarm_timers(self._unfold_alarm(alarm_name, folded))
+
+    @callback
+    def _on_alarm_timer(self, alarm_name: str, action: str) -> None:
+        """Handle a due alarm timer."""
+        alarm = self._get_alarm(alarm_name)
+        if alarm is None:
+            return
+
+        # Skip timers whose option has since been disabled
+        enabled = {
+            SCHEDULE_ESCALATE: self._escalate_after,
+            SCHEDULE_RENOTIFY: self._renotify_interval,
+            SCHEDULE_EXPIRE: self._expire_acknowledged_after,
+        }
+        if not enabled[action]:
+            return
+
+        if action == SCHEDULE_EXPIRE:
+            self._clear_alarm_by_name(alarm_name)
+        elif action == SCHEDULE_ESCALATE:
+            alarm[ATTR_SEVERITY] = SEVERITY_CRITICAL
+            self._update_folded_alarm(alarm)
+            self._send_notification(
+                alarm_name,
+                alarm[ATTR_SENSOR_ENTITY],
+                alarm[ATTR_THRESHOLD_VALUE],
+                SEVERITY_CRITICAL,
+                force=True,
+            )
+        elif action == SCHEDULE_RENOTIFY:
+            self._send_notification(
+                alarm_name,
+                alarm[ATTR_SENSOR_ENTITY],
+                alarm[ATTR_THRESHOLD_VALUE],
+                alarm[ATTR_SEVERITY],
+                force=True,
+            )
+            if self._renotify_interval:
+                self._scheduler.async_schedule(
+                    alarm_name,
+                    SCHEDULE_RENOTIFY,
+                    dt_util.utcnow() + self._renotify_interval,
+                )
+
+        self.async_write_ha_state()
+
+    def _enforce_alarm_capacity(self) -> None:
+        """Fold the oldest, least severe alarms into summary counters."""
+        while len(self._active_alarms) > self._max_active_alarms:
+            # Warnings go before criticals, oldest first
+            index = next(
+                (
+                    i
+                    for i, alarm in enumerate(self._active_alarms)
+                    if alarm[ATTR_SEVERITY] == SEVERITY_WARNING
+                ),
+                0,
+            )
+            alarm = self._active_alarms.pop(index)
+            self._overflow_alarms[alarm[ATTR_ALARM_NAME]] = self._fold_alarm(alarm)
+            self._move_overflow_severity(None, alarm[ATTR_SEVERITY])
+
+    @staticmethod
+    def _fold_alarm(alarm: Dict[str, Any]) -> _FoldedAlarm:
+        """Get the compact record kept for a folded alarm."""
+        return _FoldedAlarm(
+            alarm[ATTR_TIMESTAMP],
+            alarm[ATTR_THRESHOLD_VALUE],
+            alarm[ATTR_SENSOR_ENTITY],
+            alarm[ATTR_SEVERITY],
+            alarm.get(ATTR_ACKNOWLEDGED),
+        )
+
+    @staticmethod
+    def _unfold_alarm(alarm_name: str, folded: _FoldedAlarm) -> Dict[str, Any]:
+        """Rebuild a detailed alarm record from a folded one."""
+        alarm = {
+            ATTR_ALARM_NAME: alarm_name,
+            ATTR_TIMESTAMP: folded.timestamp,
+            ATTR_THRESHOLD_VALUE: folded.threshold_value,
+            ATTR_SENSOR_ENTITY: folded.sensor_entity,
+            ATTR_SEVERITY: folded.severity,
+        }
+        if folded.acknowledged is not None:
+            alarm[ATTR_ACKNOWLEDGED] = folded.acknowledged
+        return alarm
+
+    def _update_folded_alarm(self, alarm: Dict[str, Any]) -> None:
+        """Write changes to a copy of a folded alarm back to its record."""
+        alarm_name = alarm[ATTR_ALARM_NAME]
+        folded = self._overflow_alarms.get(alarm_name)
+        if folded is None:
+            return
+
+        if folded.severity != alarm[ATTR_SEVERITY]:
+            self._move_overflow_severity(folded.severity, alarm[ATTR_SEVERITY])
+        self._overflow_alarms[alarm_name] = self._fold_alarm(alarm)
+
+    def _refill_alarm_capacity(self) -> None:
+        """Move folded alarms back into the detailed list while there is room."""
+        room = self._max_active_alarms - len(self._active_alarms)
+        if room <= 0 or not self._overflow_alarms:
+            return
+
+        # Reverse of the fold order: criticals first, most recently folded first
+        refill = sorted(
+            reversed(self._overflow_alarms),
+            key=lambda name: self._overflow_alarms[name].severity != SEVERITY_CRITICAL,
+        )[:room]
+
+        for alarm_name in refill:
+            alarm = self._unfold_alarm(alarm_name, self._overflow_alarms[alarm_name])
+            self._discard_overflow_alarm(alarm_name)
+            # The front of the list is folded first again
+            self._active_alarms.insert(0, alarm)
+
+    def _move_overflow_severity(
+        self, from_severity: Optional[str], to_severity: Optional[str]
+    ) -> None:
+        """Move one folded alarm between severity counters."""
+        if from_severity is not None:
+            self._overflow_by_severity[from_severity] -= 1
+            if not self._overflow_by_severity[from_severity]:
+                del self._overflow_by_severity[from_severity]
+        if to_severity is not None:
+            self._overflow_by_severity[to_severity] = (
+                self._overflow_by_severity.get(to_severity, 0) + 1
+            )
+
+    def _discard_overflow_alarm(self, alarm_name: str) -> None:
+        """Remove a folded alarm and decrement its summary counters."""
+        folded = self._overflow_alarms.pop(alarm_name, None)
+        if folded is None:
+            return
+
+        self._move_overflow_severity(folded.severity, None)
 
     def _clear_alarm_by_name(self, alarm_name: str) -> None:
         """Clear alarm by name."""
         self._active_alarms = [
             a for a in self._active_alarms if a[ATTR_ALARM_NAME] != alarm_name
         ]
+        self._discard_overflow_alarm(alarm_name)
+        self._scheduler.async_cancel(alarm_name)
         # Remove from debounce tracking
         self._last_notified_alarms.discard(alarm_name)
+        self._refill_alarm_capacity()
 
     def _clear_alarms_by_sensor(self, sensor_entity: str) -> None:
         """Clear all alarms for a sensor."""
@@ -285,6 +702,9 @@ class AlarmMonitorSensor(SensorEntity):
             for a in self._active_alarms
             if a[ATTR_ALARM_NAME].startswith(sensor_entity)
         ]
+        folded_to_clear = [
+            name for name in self._overflow_alarms if name.startswith(sensor_entity)
+        ]
 
         self._active_alarms = [
             a
@@ -292,23 +712,38 @@ class AlarmMonitorSensor(SensorEntity):
             if not a[ATTR_ALARM_NAME].startswith(sensor_entity)
         ]
 
+        for alarm_name in folded_to_clear:
+            self._discard_overflow_alarm(alarm_name)
+
+        for alarm_name in alarms_to_clear + folded_to_clear:
+            self._scheduler.async_cancel(alarm_name)
+
         # Remove from debounce tracking
-        for alarm_name in alarms_to_clear:
+        for alarm_name in alarms_to_clear + folded_to_clear:
             self._last_notified_alarms.discard(alarm_name)
 
+        self._refill_alarm_capacity()
+
     def _send_notification(
-        self, alarm_name: str, sensor_entity: str, threshold_value: Optional[str]
+        self,
+        alarm_name: str,
+        sensor_entity: str,
+        threshold_value: Optional[str],
+        severity: str,
+        force: bool = False,
     ) -> None:
         """Send persistent notification."""
-        # Debounce: only notify if not already notified
-        if alarm_name in self._last_notified_alarms:
+        # Debounce: only notify if not already notified, unless forced by a timer
+        if alarm_name in self._last_notified_alarms and not force:
             return
 
         self._last_notified_alarms.add(alarm_name)
 
         title = f"Alarm: {alarm_name}"
         message = (
-            f"Sensor: {sensor_entity}\nThreshold: {threshold_value or 'binary_alert'}"
+            f"Sensor: {sensor_entity}\n"
+            f"Threshold: {threshold_value or 'binary_alert'}\n"
+            f"Severity: {severity}"
         )
 
         self.hass.async_create_task(
@@ -326,14 +761,20 @@ class AlarmMonitorSensor(SensorEntity):
     @property
     def native_value(self) -> str:
         """Return the state (number of active alarms)."""
-        return str(len(self._active_alarms))
+        return str(len(self._active_alarms) + len(self._overflow_alarms))
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        return {
+        attributes: Dict[str, Any] = {
             ATTR_ACTIVE_ALARMS: self._active_alarms,
         }
+        if self._overflow_alarms:
+            attributes[ATTR_OVERFLOW_ALARMS] = {
+                ATTR_OVERFLOW_TOTAL: len(self._overflow_alarms),
+                ATTR_OVERFLOW_BY_SEVERITY: dict(self._overflow_by_severity),
+            }
+        return attributes
 
     def can_clear_alarm(self, alarm_name: str) -> bool:
         """Check if alarm can be cleared (sensor in safe range)."""
@@ -347,19 +788,32 @@ class AlarmMonitorSensor(SensorEntity):
             if alarm_name.startswith(entity_id):
                 # Get current sensor state
                 state = self.hass.states.get(entity_id)
-                if state is None or state.state in ("unknown", "unavailable"):
+                if state is None:
                     return False
 
-                try:
-                    value = float(state.state)
-                    s_minus = config[ATTR_S_MINUS]
-                    s_plus = config[ATTR_S_PLUS]
-                    return s_minus <= value <= s_plus
-                except (ValueError, TypeError):
+                value = self._normalize_state(entity_id, state, config)
+                if value is None:
                     return False
 
+                return config[ATTR_S_MINUS] <= value <= config[ATTR_S_PLUS]
+
         return False
 
+    def acknowledge_alarm(self, alarm_name: str) -> bool:
+        """Acknowledge an alarm, stopping escalation and re-notification."""
+        alarm = self._get_alarm(alarm_name)
+        if alarm is None:
+            return False
+
+        if ATTR_ACKNOWLEDGED not in alarm:
+            alarm[ATTR_ACKNOWLEDGED] = dt_util.now().isoformat()
+            self._update_folded_alarm(alarm)
+            self._scheduler.async_cancel(alarm_name)
+            self._schedule_alarm_timers(alarm)
+
+        self.async_write_ha_state()
+        return True
+
     def clear_alarm(self, alarm_name: str) -> None:
         """Clear an alarm by name."""
         self._clear_alarm_by_name(alarm_name)
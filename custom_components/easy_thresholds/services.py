@@ -8,6 +8,7 @@ from .const import (
     DOMAIN,
     _LOGGER,
     SERVICE_CLEAR_ALARM,
+    SERVICE_ACKNOWLEDGE_ALARM,
     ATTR_ALARM_NAME,
 )
 
@@ -38,6 +39,23 @@ def async_setup_services(hass: HomeAssistant) -> None:
 
         alarm_monitor.clear_alarm(alarm_name)
 
+    async def acknowledge_alarm_service(call: ServiceCall) -> None:
+        """Handle acknowledge alarm service call."""
+        alarm_name = call.data.get(ATTR_ALARM_NAME)
+
+        if not alarm_name:
+            _LOGGER.error("acknowledge_alarm service called without alarm_name")
+            return
+
+        # Get the alarm monitor sensor
+        alarm_monitor = hass.data.get(DOMAIN, {}).get("alarm_monitor")
+        if not alarm_monitor:
+            _LOGGER.error("Alarm monitor sensor not found")
+            return
+
+        if not alarm_monitor.acknowledge_alarm(alarm_name):
+            _LOGGER.warning(f"Cannot acknowledge alarm {alarm_name}: alarm not found")
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_CLEAR_ALARM,
@@ -49,7 +67,19 @@ def async_setup_services(hass: HomeAssistant) -> None:
         ),
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ACKNOWLEDGE_ALARM,
+        acknowledge_alarm_service,
+        schema=vol.Schema(
+            {
+                vol.Required(ATTR_ALARM_NAME): cv.string,
+            }
+        ),
+    )
+
 
 def async_unload_services(hass: HomeAssistant) -> None:
     """Unload services."""
     hass.services.async_remove(DOMAIN, SERVICE_CLEAR_ALARM)
+    hass.services.async_remove(DOMAIN, SERVICE_ACKNOWLEDGE_ALARM)